@@ -1,9 +1,18 @@
 import os
+import atexit
+import errno
+import re
+import heapq
+import itertools
 import shutil
+import stat
 import subprocess
-import fnmatch
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+if os.name == "nt":
+    import msvcrt
+
 # Blocklist of system directories to protect
 # (Even with home-containment, these provide an extra layer of safety if paths are malformed)
 SYSTEM_DIRS = [
@@ -17,9 +26,64 @@ SYSTEM_DIRS = [
     r"C:\System Volume Information"
 ]
 
+# Resolved once at import: the home directory and the blocklist prefixes do not
+# change during a session, and is_safe_path() runs for every walked entry.
+_HOME = Path.home().resolve()
+_HOME_STR = str(_HOME)
+# normcase'd forms for containment checks; join with "" adds exactly one
+# trailing separator (and none when Home is the filesystem root).
+_HOME_CMP = os.path.normcase(_HOME_STR)
+_HOME_PREFIX = os.path.join(_HOME_CMP, "")
+# One anchored alternation instead of a startswith() per blocklist entry; the
+# trailing group only matches whole path components ("/usr", not "/usrdata").
+_SYS_RE = re.compile(
+    "(?:"
+    + "|".join(re.escape(str(Path(os.path.expandvars(sys_dir)).resolve())) for sys_dir in SYSTEM_DIRS)
+    + r")(?:[\\/]|$)",
+    re.IGNORECASE,
+)
+
+# Descriptor-relative directory walking (POSIX); see _scan
+_FD_WALK = (
+    os.scandir in os.supports_fd
+    and os.open in os.supports_dir_fd
+    and hasattr(os, "O_DIRECTORY")
+    and hasattr(os, "O_NOFOLLOW")
+)
+_DIR_OPEN_FLAGS = (
+    os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+
+# stat.IO_REPARSE_TAG_MOUNT_POINT (the junction tag) only exists on Windows
+_IO_REPARSE_TAG_MOUNT_POINT = getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", 0xA0000003)
+
+# os.link errors meaning "no hard links here" rather than a real failure
+_NO_HARDLINK_ERRNOS = frozenset(
+    getattr(errno, name) for name in ("EXDEV", "EPERM", "EINVAL", "ENOTSUP", "EOPNOTSUPP", "ENOSYS")
+    if hasattr(errno, name)
+)
+
+# Upper bound on files returned by find_files and acted on by move/delete
+MAX_RESULTS = 50
+
+# Worker threads for concurrent move/delete I/O
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Large or tool-managed directories that never hold files the user means
+# to find/move/delete; skipped without being opened. Hidden directories
+# (.git, .venv, .cache, ...) are skipped as well.
+_DIR_EXCLUDES = frozenset({
+    "AppData",
+    "Library",
+    "node_modules",
+    "__pycache__",
+    "venv",
+})
+
 def get_home_dir():
     """Returns the absolute path to the user's home directory."""
-    return Path.home().resolve()
+    return _HOME
 
 def resolve_path(path_str):
     """
@@ -27,11 +91,10 @@ def resolve_path(path_str):
     - If None/Empty: Returns Home Directory.
     - If Absolute: Returns it (will be checked by is_safe_path).
     - If Relative: Resolves Relative to Home Directory.
+    - A leading '~' is expanded to the Home Directory.
     """
-    home = get_home_dir()
-    
     if not path_str:
-        return home
+        return _HOME
         
     # If the user says "Downloads", we want Home/Downloads
     # If the user says "actions.py" (current dir), we might need to be careful.
@@ -43,11 +106,17 @@ def resolve_path(path_str):
     # Let's adhere to: Relative paths are relative to HOME, unless they start with ./ which might imply CWD?
     # Actually, for a file manager style usage, assuming Home as root is safest/most logical.
     
-    path = Path(path_str)
-    if path.is_absolute():
-        return path.resolve()
-    else:
-        return (home / path).resolve()
+    # os.path.join keeps absolute paths as they are and anchors relative ones
+    # at Home. realpath (not just normpath) is required: symlinks must be
+    # resolved before is_safe_path checks containment.
+    path = os.path.join(_HOME_STR, os.path.expanduser(os.fspath(path_str)))
+    return Path(os.path.realpath(path))
+
+def is_system_path(path):
+    """
+    Returns True if a resolved path lies in one of the SYSTEM_DIRS.
+    """
+    return _SYS_RE.match(os.fspath(path)) is not None
 
 def is_safe_path(path_str):
     """
@@ -63,26 +132,40 @@ def is_safe_path(path_str):
         else:
             path = resolve_path(path_str)
             
-        home = get_home_dir()
-        
         # 1. Strict Containment Check
-        # is_relative_to returns True if path is inside home
-        if not path.is_relative_to(home):
-            print(f"DEBUG: Blocked path '{path}' - Not inside Home '{home}'")
+        # Both sides are absolute and normalized, so a string prefix test is
+        # equivalent to Path.is_relative_to and avoids building path parts.
+        p = os.path.normcase(os.fspath(path))
+        if p != _HOME_CMP and not p.startswith(_HOME_PREFIX):
+            print(f"DEBUG: Blocked path '{path}' - Not inside Home '{_HOME}'")
             return False
             
         # 2. explicit defined system blocklist (redundant but safe)
-        path_str_lower = str(path).lower()
-        for sys_dir in SYSTEM_DIRS:
-            sys_path = Path(os.path.expandvars(sys_dir)).resolve()
-            if path_str_lower.startswith(str(sys_path).lower()):
-                 return False
+        if is_system_path(path):
+            return False
 
         return True
     except Exception as e:
         print(f"DEBUG: Path check error: {e}")
         return False
 
+def _list_entry(entry):
+    """
+    Formats a DirEntry for list_files as a (is_file, sort_key, text) tuple.
+    """
+    # is_dir/is_file come from the cached readdir type on POSIX (and from
+    # FindFirstFile on Windows); only regular files are stat'ed for a size
+    if _entry_is(entry.is_dir):
+        type_str, size_str = "DIR ", "-"
+    else:
+        type_str = "FILE"
+        try:
+            size_str = f"{entry.stat().st_size}b" if entry.is_file() else "-"
+        except OSError:
+            size_str = "-"  # Broken or unreadable symlink
+    item = f"[{type_str}] {entry.name} ({size_str})"
+    return (type_str == "FILE", item.lower(), item)
+
 def list_files(path=None):
     """
     Lists files and directories in the given path.
@@ -92,68 +175,187 @@ def list_files(path=None):
     if not is_safe_path(target_path):
         return f"Error: Access to '{target_path}' is RESTRICTED (Outside User Home)."
         
-    if not os.path.exists(target_path):
-        return f"Error: Path '{target_path}' does not exist."
-        
-    if not os.path.isdir(target_path):
-        return f"Error: '{target_path}' is not a directory."
-
-    items = []
     try:
         with os.scandir(target_path) as it:
-            for entry in it:
-                type_str = "DIR " if entry.is_dir() else "FILE"
-                size_str = f"{entry.stat().st_size}b" if entry.is_file() else "-"
-                items.append(f"[{type_str}] {entry.name} ({size_str})")
-                
-        # Sort directories first, then files
-        items.sort(key=lambda x: (x.startswith("[FILE]"), x.lower()))
-        return items[:100]
+            # Directories first, then files. nsmallest keeps a 100-item heap
+            # instead of building and sorting the whole directory listing.
+            top = heapq.nsmallest(100, map(_list_entry, it))
+        return [item for _, _, item in top]
+    except FileNotFoundError:
+        return f"Error: Path '{target_path}' does not exist."
+    except NotADirectoryError:
+        return f"Error: '{target_path}' is not a directory."
     except PermissionError:
         return f"Error: Permission denied accessing '{target_path}'."
     except Exception as e:
         return f"Error listing files: {e}"
 
-def find_files(file_type=None, source_path=None):
+def _entry_is(check, **kwargs):
     """
-    Finds files matching a type in a source path.
+    Runs a DirEntry is_dir/is_file check, treating a stat error (symlink
+    loop, unreadable target, ...) as False the way os.walk does.
+    """
+    try:
+        return check(**kwargs)
+    except OSError:
+        return False
+
+def _is_junction(entry):
+    """
+    Returns True for NTFS junctions (mount-point reparse points). Before
+    Python 3.12 a junction reports is_dir(follow_symlinks=False) and not
+    is_symlink(), so without this check the walk would follow it out of Home.
+    Other reparse points, such as OneDrive placeholder folders, are real
+    directories and are walked, as os.walk does.
+    """
+    is_junction = getattr(entry, "is_junction", None)
+    if is_junction is not None:
+        return is_junction()
+    try:
+        st = entry.stat(follow_symlinks=False)
+    except OSError:
+        return True  # Cannot tell, so do not descend
+    return getattr(st, "st_reparse_tag", 0) == _IO_REPARSE_TAG_MOUNT_POINT
+
+def _scan(path, suffix, skip_dir=None, parent_fd=None):
+    """
+    Recursively yields files under path, optionally filtered by suffix.
+    Being a generator, directories are only opened as results are consumed.
+    Directory symlinks and Windows junctions are not followed, so every
+    visited directory stays inside the validated start directory; file
+    symlinks are yielded only if their target passes is_safe_path.
+    On POSIX each directory is opened relative to its parent's descriptor
+    with O_NOFOLLOW (as os.fwalk does), so a directory swapped for a symlink
+    mid-walk cannot lead outside Home, and no full path is re-resolved.
+    """
+    suffix_len = len(suffix) if suffix else 0
+    fd = None
+    try:
+        if _FD_WALK:
+            if parent_fd is None:
+                fd = os.open(path, _DIR_OPEN_FLAGS)
+            else:
+                fd = os.open(os.path.basename(path), _DIR_OPEN_FLAGS, dir_fd=parent_fd)
+                
+        # scandir(fd) still yields DirEntry objects with cached file types,
+        # which os.fwalk would throw away; only the entry paths need joining
+        it = os.scandir(path if fd is None else fd)
+    except OSError:
+        # Same as os.walk: unreadable directories are skipped silently
+        if fd is not None:
+            os.close(fd)
+        return
+        
+    try:
+        with it:
+            while True:
+                # Like os.walk, a read error ends this directory only
+                try:
+                    entry = next(it)
+                except StopIteration:
+                    break
+                except OSError:
+                    return
+                    
+                name = entry.name
+                entry_path = entry.path if fd is None else os.path.join(path, name)
+                
+                if _entry_is(entry.is_dir, follow_symlinks=False):
+                    if name[0] == "." or name in _DIR_EXCLUDES or entry_path == skip_dir:
+                        continue
+                    if fd is None and _is_junction(entry):
+                        continue
+                    yield from _scan(entry_path, suffix, skip_dir, fd)
+                    continue
+                    
+                # endswith() is allocation-free for exact-case matches; only
+                # otherwise lowercase the trailing slice, never the full name.
+                if suffix and not name.endswith(suffix) and name[-suffix_len:].lower() != suffix:
+                    continue
+                    
+                if _entry_is(entry.is_file, follow_symlinks=False):
+                    yield entry_path
+                elif entry.is_symlink() and _entry_is(entry.is_file) and is_safe_path(entry_path):
+                    yield entry_path
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+def iter_files(file_type=None, source_path=None, skip_dir=None, limit=MAX_RESULTS):
+    """
+    Returns a lazy iterator over at most limit files matching a type in a
+    source path (limit=None for no cap).
+    Raises ValueError if the source path is restricted or does not exist.
     """
     start_dir = resolve_path(source_path)
     
-    if not is_safe_path(source_path): # Check original string too just in case
-         if not is_safe_path(start_dir):
-            return f"Error: Access to '{start_dir}' is RESTRICTED."
-    
-    results = []
+    if not is_safe_path(start_dir):
+        raise ValueError(f"Error: Access to '{start_dir}' is RESTRICTED.")
     
     if not os.path.exists(start_dir):
-        return f"Error: Source path '{start_dir}' does not exist."
+        raise ValueError(f"Error: Source path '{start_dir}' does not exist.")
 
     print(f"Searching in: {start_dir}")
     
-    count = 0
-    max_count = 50
-    
-    for root, dirnames, filenames in os.walk(start_dir):
-        # Prevent recursing into unsafe directories (though they shouldn't be under Home)
-        # But 'AppData' might be large or sensitive.
-        if not is_safe_path(root):
-            dirnames[:] = []
-            continue
-            
-        for filename in filenames:
-            if file_type:
-                if filename.lower().endswith(f".{file_type.lower()}"):
-                     results.append(os.path.join(root, filename))
-                     count += 1
-            else:
-                results.append(os.path.join(root, filename))
-                count += 1
-                
-            if count >= max_count:
-                return results
-                
-    return results
+    suffix = f".{file_type.lower()}" if file_type else None
+    # islice applies the cap without per-file counting; once it stops
+    # pulling from the walk, unvisited directories are never opened
+    return itertools.islice(_scan(str(start_dir), suffix, skip_dir), limit)
+
+def find_files(file_type=None, source_path=None):
+    """
+    Finds files matching a type in a source path.
+    """
+    try:
+        return list(iter_files(file_type, source_path))
+    except ValueError as e:
+        return str(e)
+
+def _run_file_ops(op, file_paths, verb):
+    """
+    Runs op(file_path) for each path on a thread pool.
+    The work is blocking filesystem I/O, which releases the GIL, so
+    independent moves/deletes overlap. Paths are submitted as the walk
+    yields them. Returns (success_count, errors).
+    """
+    done_count = 0
+    errors = []
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        futures = {executor.submit(op, file_path): file_path for file_path in file_paths}
+        for future in as_completed(futures):
+            try:
+                future.result()
+                done_count += 1
+            except Exception as e:
+                errors.append(f"Failed to {verb} {futures[future]}: {e}")
+    return done_count, errors
+
+def _move_file(file_path, dest_dir):
+    """
+    Moves a file into dest_dir without ever replacing an existing file.
+    The file is hard-linked to its new name, which fails atomically if the
+    name is taken, and then unlinked from the old one. Where hard links are
+    unavailable (another filesystem, FAT, ...) it falls back to shutil.move.
+    """
+    target = os.path.join(dest_dir, os.path.basename(file_path))
+    try:
+        # follow_symlinks=False moves a symlink itself, as a rename would
+        if os.link in os.supports_follow_symlinks:
+            os.link(file_path, target, follow_symlinks=False)
+        else:
+            os.link(file_path, target)
+    except FileExistsError:
+        raise shutil.Error(f"Destination path '{target}' already exists")
+    except OSError as e:
+        if e.errno not in _NO_HARDLINK_ERRNOS:
+            raise
+        # Same refusal as shutil.move; concurrent moves of one name are
+        # already ruled out by move_files
+        if os.path.lexists(target):
+            raise shutil.Error(f"Destination path '{target}' already exists")
+        shutil.move(file_path, target)
+        return
+    os.unlink(file_path)
 
 def move_files(file_type, destination_path, source_path=None):
     """
@@ -168,28 +370,40 @@ def move_files(file_type, destination_path, source_path=None):
     if not is_safe_path(src_dir) or not is_safe_path(dest_dir):
         return "Error: unsafe path detected (Outside User Home)."
 
-    if not os.path.exists(dest_dir):
-        try:
-            os.makedirs(dest_dir)
-        except OSError as e:
-            return f"Error creating destination: {e}"
+    try:
+        os.makedirs(dest_dir, exist_ok=True)
+    except OSError as e:
+        return f"Error creating destination: {e}"
 
-    moved_count = 0
-    errors = []
-    
-    files_to_move = find_files(file_type, source_path)
-    if isinstance(files_to_move, str):
-        return files_to_move
+    # Files are moved as the walk finds them; the destination is skipped so
+    # files already moved into it are not picked up again.
+    try:
+        files_to_move = iter_files(file_type, source_path, skip_dir=str(dest_dir))
+    except ValueError as e:
+        return str(e)
         
-    for file_path in files_to_move:
-        if not is_safe_path(file_path):
-            continue
+    # Moves run concurrently, so two files with the same name would race for
+    # the same target. Only the first one is moved, as a sequential loop would.
+    # Names are casefolded since the destination may be case-insensitive
+    # (NTFS, default APFS) even where os.path.normcase is a no-op.
+    duplicates = []
+    seen_names = set()
+    
+    def unique_names(paths):
+        for file_path in paths:
+            name = os.path.basename(file_path).casefold()
+            if name in seen_names:
+                duplicates.append(f"Failed to move {file_path}: a file with that name is already being moved")
+                continue
+            seen_names.add(name)
+            yield file_path
             
-        try:
-            shutil.move(file_path, dest_dir)
-            moved_count += 1
-        except Exception as e:
-            errors.append(f"Failed to move {file_path}: {e}")
+    moved_count, errors = _run_file_ops(
+        lambda file_path: _move_file(file_path, dest_dir),
+        unique_names(files_to_move),
+        "move",
+    )
+    errors += duplicates
             
     return f"Moved {moved_count} files to {dest_dir}. Errors: {len(errors)}"
 
@@ -202,25 +416,104 @@ def delete_files(file_type, source_path=None):
     if not is_safe_path(src_dir):
         return "Error: unsafe path detected (Outside User Home)."
         
-    deleted_count = 0
-    errors = []
-    
-    files_to_delete = find_files(file_type, source_path)
-    if isinstance(files_to_delete, str):
-        return files_to_delete
+    try:
+        files_to_delete = iter_files(file_type, source_path)
+    except ValueError as e:
+        return str(e)
         
-    for file_path in files_to_delete:
-        if not is_safe_path(file_path):
-            continue
-            
-        try:
-            os.remove(file_path)
-            deleted_count += 1
-        except Exception as e:
-            errors.append(f"Failed to delete {file_path}: {e}")
+    deleted_count, errors = _run_file_ops(os.remove, files_to_delete, "delete")
             
     return f"Deleted {deleted_count} files from {src_dir}. Errors: {len(errors)}"
 
+# Executed by a pre-started interpreter: waits for a script path on the pipe
+# named by _AICLI_PATH_FD, then runs it as __main__ from the script's
+# directory, like `python script.py`. stdin is left alone, so the script can
+# still read the user's terminal. Tracebacks start at the script's own frame
+# instead of this bootstrap and runpy.
+_WORKER_BOOTSTRAP = """
+import os, runpy, sys, traceback
+fd = int(os.environ.pop("_AICLI_PATH_FD"))
+if os.name == "nt":
+    import msvcrt
+    fd = msvcrt.open_osfhandle(fd, os.O_RDONLY)
+with open(fd, "rb") as f:
+    path = os.fsdecode(f.readline().rstrip(b"\\n"))
+if not path:
+    sys.exit()
+os.chdir(os.path.dirname(path))
+sys.argv = [path]
+sys.path[0] = os.path.dirname(path)
+try:
+    runpy.run_path(path, run_name="__main__")
+except SystemExit:
+    raise
+except BaseException as e:
+    tb = e.__traceback__
+    while tb is not None and tb.tb_frame.f_code.co_filename != path:
+        tb = tb.tb_next
+    # No script frame (e.g. SyntaxError): the message carries the location
+    traceback.print_exception(type(e), e, tb)
+    sys.exit(1)
+"""
+
+# Idle interpreter kept warm for the next execute_python_file call, as a
+# (process, write end of its path pipe) pair
+_spare_worker = None
+
+def _spawn_worker():
+    read_fd, write_fd = os.pipe()
+    try:
+        if os.name == "nt":
+            handle = msvcrt.get_osfhandle(read_fd)
+            os.set_handle_inheritable(handle, True)
+            inherited = {"startupinfo": subprocess.STARTUPINFO(lpAttributeList={"handle_list": [handle]})}
+            fd_value = handle
+        else:
+            inherited = {"pass_fds": (read_fd,)}
+            fd_value = read_fd
+        process = subprocess.Popen(
+            ["python", "-c", _WORKER_BOOTSTRAP],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env={**os.environ, "_AICLI_PATH_FD": str(fd_value)},
+            **inherited,
+        )
+    except BaseException:
+        os.close(write_fd)
+        raise
+    finally:
+        os.close(read_fd)
+    return process, write_fd
+
+def _discard_worker(worker):
+    process, write_fd = worker
+    os.close(write_fd)
+    process.kill()
+    process.wait()
+
+def _take_worker():
+    """
+    Returns an already-started interpreter and starts its replacement, so
+    interpreter startup overlaps with the time between executions.
+    Each worker runs a single script, so scripts never share state.
+    """
+    global _spare_worker
+    worker = _spare_worker
+    _spare_worker = None
+    if worker is not None and worker[0].poll() is not None:
+        _discard_worker(worker)
+        worker = None
+    if worker is None:
+        worker = _spawn_worker()
+    _spare_worker = _spawn_worker()
+    return worker
+
+@atexit.register
+def _stop_spare_worker():
+    if _spare_worker is not None:
+        _discard_worker(_spare_worker)
+
 def execute_python_file(path):
     """
     Executes a python file.
@@ -240,17 +533,17 @@ def execute_python_file(path):
         return f"Error: File '{target_path}' not found."
 
     try:
-        # We assume the user wants to run relative to the script's dir usually
-        # But for this tool, let's keep it simple.
-        cwd = os.path.dirname(target_path)
-        
-        result = subprocess.run(
-            ["python", target_path], 
-            capture_output=True, 
-            text=True, 
-            timeout=30,
-            cwd=cwd
-        )
-        return f"Output:\n{result.stdout}\nErrors:\n{result.stderr}"
+        # The worker runs the script from its own directory
+        process, write_fd = _take_worker()
+        try:
+            os.write(write_fd, os.fsencode(target_path) + b"\n")
+        finally:
+            os.close(write_fd)
+        stdout, stderr = process.communicate(timeout=30)
+        return f"Output:\n{stdout}\nErrors:\n{stderr}"
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        return f"Execution failed: '{target_path}' timed out after 30 seconds"
     except Exception as e:
         return f"Execution failed: {e}"
@@ -1,9 +1,27 @@
 import os
+import re
+import sys
 import json
-from openai import OpenAI
+import httpx
+import msgspec
+from openai import OpenAI, DefaultHttpxClient
 from dotenv import load_dotenv
 import actions
-from system_prompt import SYSTEM_PROMPT
+from system_prompt import SYSTEM_PROMPT, parse_response
+
+# Opening ```/```json and closing ``` fences around the model's JSON
+_FENCE_RE = re.compile(r"^```(?:json)?|```$")
+
+# Message roles, interned once and shared by every history entry
+_ROLE_SYS = sys.intern("system")
+_ROLE_USER = sys.intern("user")
+_ROLE_ASST = sys.intern("assistant")
+
+# Built once; every session's history starts with this same dict
+_SYSTEM_MSG = {"role": _ROLE_SYS, "content": SYSTEM_PROMPT}
+
+# User/assistant exchanges kept in the conversation history
+MAX_TURNS = 8
 
 # Load environment variables
 load_dotenv()
@@ -17,28 +35,32 @@ def setup_client():
         print("Please set it in a .env file: OPENROUTER_API_KEY=sk-or-...")
         return None
         
+    # One pooled HTTP/2 connection is reused across turns, so only the first
+    # request pays for the TLS handshake. DefaultHttpxClient keeps the SDK's
+    # own timeout and redirect defaults; only HTTP/2 and the keep-alive pool
+    # (max_connections is the SDK default) differ.
+    http_client = DefaultHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=4),
+    )
+    
     # OpenRouter Configuration
     client = OpenAI(
         base_url="https://openrouter.ai/api/v1",
         api_key=api_key,
+        http_client=http_client,
     )
     return client
 
 def parse_json_response(text):
     """
-    Extracts JSON from the model's response.
+    Extracts the command from the model's response.
     Handles potential markdown code blocks.
+    Returns None if it is not valid JSON or does not match CommandResponse.
     """
     try:
-        clean_text = text.strip()
-        if clean_text.startswith("```json"):
-            clean_text = clean_text[7:]
-        if clean_text.startswith("```"):
-            clean_text = clean_text[3:]
-        if clean_text.endswith("```"):
-            clean_text = clean_text[:-3]
-        return json.loads(clean_text)
-    except json.JSONDecodeError:
+        return parse_response(_FENCE_RE.sub("", text.strip()))
+    except msgspec.DecodeError:
         return None
 
 def main():
@@ -49,9 +71,7 @@ def main():
     if not client:
         return
         
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT}
-    ]
+    messages = [_SYSTEM_MSG]
 
     while True:
         try:
@@ -63,7 +83,7 @@ def main():
                 continue
             
             # Add user message to history
-            messages.append({"role": "user", "content": user_input})
+            messages.append({"role": _ROLE_USER, "content": user_input})
             
             # Call OpenRouter
             # Using google/gemini-2.0-flash-001 as a good default for OpenRouter if available, 
@@ -77,29 +97,40 @@ def main():
                 extra_headers={
                     "HTTP-Referer": "https://antigravity.dev", # Optional
                     "X-Title": "Antigravity CLI", # Optional
-                }
+                },
+                stream=True,
             )
             
-            response_text = completion.choices[0].message.content
+            # Collect the streamed chunks (some, e.g. usage, carry no choices)
+            chunks = []
+            for chunk in completion:
+                if chunk.choices:
+                    chunks.append(chunk.choices[0].delta.content or "")
+            response_text = "".join(chunks)
             
             # Add assistant response to history
-            messages.append({"role": "assistant", "content": response_text})
+            messages.append({"role": _ROLE_ASST, "content": response_text})
+            
+            # Keep the system prompt plus the last MAX_TURNS exchanges so the
+            # request size (and token spend) stays bounded
+            if len(messages) > 1 + 2 * MAX_TURNS:
+                del messages[1:len(messages) - 2 * MAX_TURNS]
 
             # Parse JSON
             command_data = parse_json_response(response_text)
             
-            if not command_data:
+            if command_data is None:
                 print(f"AI (Raw): {response_text}")
-                print("Error: Could not parse JSON from AI response.")
+                print("Error: Could not parse a valid command from AI response.")
                 continue
                 
-            print(f"\nAI Proposal: {json.dumps(command_data, indent=2)}")
+            print(f"\nAI Proposal: {json.dumps(msgspec.to_builtins(command_data), indent=2)}")
             
-            action = command_data.get("action")
-            file_type = command_data.get("file_type")
-            source = command_data.get("source_path")
-            dest = command_data.get("destination_path")
-            msg = command_data.get("message")
+            action = command_data.action
+            file_type = command_data.file_type
+            source = command_data.source_path
+            dest = command_data.destination_path
+            msg = command_data.message
             
             if action == 'error':
                 print(f"AI Error: {msg}")
@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from system_prompt import SYSTEM_PROMPT
+
+# Used when tiktoken has no mapping for the model name (e.g. OpenRouter's
+# "google/gemini-2.0-flash-001")
+DEFAULT_ENCODING = "cl100k_base"
+
+@lru_cache(maxsize=8)
+def system_prompt_tokens(model):
+    """
+    Returns SYSTEM_PROMPT tokenized for the given model, encoding it only on
+    the first call per model.
+    Meant for self-hosted backends that accept token IDs; the OpenRouter path
+    in main.py sends the prompt as text. Requires tiktoken (optional).
+    """
+    import tiktoken
+    
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+    # A tuple, so the cached value cannot be mutated by callers
+    return tuple(encoding.encode(SYSTEM_PROMPT))
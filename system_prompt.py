@@ -1,2 +1,74 @@
+"""
 AL-CLI for file management using AI Gemini and an OpenRouter API
+"""
+import hashlib
+import sys
+from typing import Final, Literal, Optional, get_args
 
+import msgspec
+
+# Values the prompt allows for "action"; ActionT is the single source for
+# both the CommandResponse field type and ACTIONS.
+ActionT = Literal["list", "find", "move", "delete", "execute", "error"]
+
+# The action values and the file types the prompt lists. Interned so
+# comparisons against decoded responses can short-circuit on identity.
+ACTIONS: Final[tuple[str, ...]] = tuple(sys.intern(a) for a in get_args(ActionT))
+FILE_TYPES: Final[tuple[str, ...]] = tuple(
+    sys.intern(t) for t in ("pdf", "jpg", "png", "txt", "docx", "py")
+)
+
+# Kept deliberately terse: the prompt is resent on every request, so its
+# length multiplies the input tokens of every call.
+# Split in two so the rules/schema prefix stays byte-identical across
+# releases even when examples change, which prefix-keyed prompt caching
+# depends on. At ~150 tokens it is still below every provider's minimum
+# cacheable length (1024+ tokens), so main.py sends SYSTEM_PROMPT as a plain
+# string and no cache breakpoint can fire yet.
+SYSTEM_PROMPT_PREFIX: Final[str] = (
+    "Convert the user's file-management request into ONE JSON object. "
+    "Output only the JSON: no markdown, no prose.\n"
+    "ACTIONS: " + "|".join(ACTIONS) + "\n"
+    "- list: show a directory; find/move/delete: files of one type; "
+    "execute: run the .py file in source_path; "
+    "error: unsupported, unsafe or unclear (reason in message)\n"
+    "FILE_TYPES: " + ",".join(FILE_TYPES) + "\n"
+    "PATHS: relative to home (Downloads, Documents/Reports); "
+    "null if not named ('here', 'this folder')\n"
+    "SAFETY: only paths inside home; only .py files run; otherwise error\n"
+    'SCHEMA: {"action","file_type","source_path","destination_path","message"}, '
+    "unused fields null\n"
+    "EXAMPLES:\n"
+)
+SYSTEM_PROMPT_EXAMPLES: Final[str] = (
+    'find pdfs in Downloads -> {"action":"find","file_type":"pdf","source_path":"Downloads","destination_path":null,"message":null}\n'
+    'move jpgs from Desktop to Pictures/Holiday -> {"action":"move","file_type":"jpg","source_path":"Desktop","destination_path":"Pictures/Holiday","message":null}\n'
+    'delete txt files here -> {"action":"delete","file_type":"txt","source_path":null,"destination_path":null,"message":null}\n'
+    'run test_script.py -> {"action":"execute","file_type":"py","source_path":"test_script.py","destination_path":null,"message":null}\n'
+    'what is in Documents? -> {"action":"list","file_type":null,"source_path":"Documents","destination_path":null,"message":null}\n'
+    'delete everything in C:\\Windows -> {"action":"error","file_type":null,"source_path":null,"destination_path":null,"message":"System directories are protected."}\n'
+)
+SYSTEM_PROMPT: Final[str] = SYSTEM_PROMPT_PREFIX + SYSTEM_PROMPT_EXAMPLES
+
+# Identifies the prefix version when diagnosing prompt-cache behaviour
+PREFIX_SHA256 = hashlib.sha256(SYSTEM_PROMPT_PREFIX.encode("utf-8")).hexdigest()
+
+# Pre-encoded once for transports that send raw request bytes
+SYSTEM_PROMPT_BYTES = SYSTEM_PROMPT.encode("utf-8")
+SYSTEM_PROMPT_LEN = len(SYSTEM_PROMPT_BYTES)
+
+class CommandResponse(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
+    """
+    The prompt's SCHEMA line. Decoding into it parses and validates the
+    model's JSON in a single pass.
+    """
+    action: ActionT
+    file_type: Optional[str] = None
+    source_path: Optional[str] = None
+    destination_path: Optional[str] = None
+    message: Optional[str] = None
+
+# Built once per process; raises msgspec.DecodeError (ValidationError for
+# well-formed JSON that does not match CommandResponse)
+_decoder = msgspec.json.Decoder(CommandResponse)
+parse_response = _decoder.decode